@@ -27,6 +27,8 @@ from z3 import BoolRef, Bool, Implies, PbGe, PbEq, PbLe
 class _NamedUIDObject:
     """The base object for most ProcessScheduler classes"""
 
+    __slots__ = ("name", "uid", "assertions", "assertion_hashes")
+
     def __init__(self, name: str) -> None:
         """The base name for all ProcessScheduler objects.
 
@@ -15,10 +15,11 @@
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Optional, List
+from typing import Optional
 
-from z3 import Bool, BoolRef, Implies, PbEq, PbGe, PbLe
+from z3 import And, Bool, BoolRef, Implies, simplify
 from processscheduler.base import _NamedUIDObject
+from processscheduler.util import get_cardinality_assertion
 
 #
 # Base Constraint class
@@ -26,6 +27,8 @@ from processscheduler.base import _NamedUIDObject
 class Constraint(_NamedUIDObject):
     """The base class for all constraints, including Task and Resource constraints."""
 
+    __slots__ = ("optional", "applied")
+
     def __init__(self, optional):
         super().__init__("")
 
@@ -33,26 +36,51 @@ class Constraint(_NamedUIDObject):
         # by default, this constraint has to be applied
         self.applied = True
 
-    def set_assertions(self, list_of_z3_assertions: List[BoolRef]) -> None:
-        """Take a list of constraint to satisfy. If the constraint is optional then
-        the list of z3 assertions apply under the condition that the applied flag
+    def set_assertions(self, z3_assertion: BoolRef) -> None:
+        """Take the z3 assertion to satisfy. If the constraint is optional then
+        the assertion applies under the condition that the applied flag
         is set to True.
+
+        A constraint calls this method once, with the conjunction of all its
+        assertions. The constraint is then a single z3 assertion, that can be
+        added or retracted as a whole, e.g. between a solver push() and pop().
         """
         if self.optional:
             self.applied = Bool("constraint_%s_applied" % self.uid)
-            self.add_assertion(Implies(self.applied, list_of_z3_assertions))
+            self.add_assertion(Implies(self.applied, z3_assertion))
         else:
             self.applied = True
-            self.add_assertion(list_of_z3_assertions)
+            self.add_assertion(z3_assertion)
 
 
 class ResourceConstraint(Constraint):
     """Constraint that applies on a Resource (typically a Worker)"""
 
+    __slots__ = ()
+
 
 class TaskConstraint(Constraint):
     """Constraint that applies on a Task"""
 
+    __slots__ = ()
+
+    def set_assertions(self, z3_assertion: BoolRef) -> None:
+        """Simplify the z3 assertion before it is set, so that trivially true
+        atoms are removed once at constraint creation rather than at each solve.
+        Task constraints submit a single assertion, the conjunction of all their
+        assertions."""
+        super().set_assertions(simplify(z3_assertion))
+
+    def _guard(self, scheduled_assertion: BoolRef, *tasks) -> BoolRef:
+        """Return the assertion that applies when all the tasks are scheduled.
+        If none of the tasks is optional, the assertion is returned unchanged.
+        """
+        if not any(task.optional for task in tasks):
+            return scheduled_assertion
+        if len(tasks) == 1:
+            return Implies(tasks[0].scheduled, scheduled_assertion)
+        return Implies(And(*[task.scheduled for task in tasks]), scheduled_assertion)
+
 
 #
 # A Generic constraint that applies to both Resource or Task
@@ -62,6 +90,8 @@ class ForceApplyNOptionalConstraints(Constraint):
     at at least/at most/exactly n tasks, with 0 < n <= m. Work for both
     Task and/or Resource constraints."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         list_of_optional_constraints,
@@ -69,25 +99,18 @@ class ForceApplyNOptionalConstraints(Constraint):
         kind: Optional[str] = "exact",
         optional: Optional[bool] = False,
     ) -> None:
-        super().__init__(optional)
-
-        problem_function = {"min": PbGe, "max": PbLe, "exact": PbEq}
-
-        # first check that all tasks from the list_of_optional_tasks are
-        # actually optional
+        # all applied variables to take into account, checking on the way that
+        # all constraints from the list_of_optional_constraints are actually optional
+        applied_vars = []
         for constraint in list_of_optional_constraints:
             if not constraint.optional:
                 raise TypeError(
                     "The constraint %s must explicitly be set as optional."
                     % constraint.name
                 )
+            applied_vars.append(constraint.applied)
 
-        # all scheduled variables to take into account
-        applied_vars = [
-            constraint.applied for constraint in list_of_optional_constraints
-        ]
+        super().__init__(optional)
 
-        asst = problem_function[kind](
-            [(applied, True) for applied in applied_vars], nb_constraints_to_apply
-        )
+        asst = get_cardinality_assertion(applied_vars, nb_constraints_to_apply, kind)
         self.set_assertions(asst)
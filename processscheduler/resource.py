@@ -17,10 +17,15 @@
 
 from typing import Dict, List, Optional, Tuple
 
-from z3 import ArithRef, Bool, PbEq, PbGe, PbLe
+from z3 import ArithRef, Bool
 
 from processscheduler.base import _NamedUIDObject
-from processscheduler.util import is_strict_positive_integer, is_positive_integer
+from processscheduler.util import (
+    PB_FUNCTIONS,
+    get_cardinality_assertion,
+    is_strict_positive_integer,
+    is_positive_integer,
+)
 from processscheduler.cost import _Cost, ConstantCostPerPeriod
 import processscheduler.context as ps_context
 
@@ -106,9 +111,7 @@ class SelectWorkers(Resource):
         """create an instance of the SelectWorkers class."""
         super().__init__("")
 
-        problem_function = {"min": PbGe, "max": PbLe, "exact": PbEq}
-
-        if kind not in problem_function:
+        if kind not in PB_FUNCTIONS:
             raise ValueError("kind must be either 'exact', 'min' or 'max'")
 
         if not is_strict_positive_integer(nb_workers_to_select):
@@ -143,8 +146,8 @@ class SelectWorkers(Resource):
         # see https://github.com/Z3Prover/z3/issues/694
         # and https://stackoverflow.com/questions/43081929/k-out-of-n-constraint-in-z3py
         selection_list = list(self.selection_dict.values())
-        self.selection_assertion = problem_function[kind](
-            [(selected, True) for selected in selection_list], nb_workers_to_select
+        self.selection_assertion = get_cardinality_assertion(
+            selection_list, nb_workers_to_select, kind
         )
 
 
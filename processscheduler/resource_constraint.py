@@ -18,7 +18,7 @@
 from typing import Optional
 import uuid
 
-from z3 import And, Implies, Int, Not, Or, Sum, Xor
+from z3 import And, Implies, Int, Or, Sum, Xor
 
 from processscheduler.resource import Worker, CumulativeWorker
 from processscheduler.constraint import ResourceConstraint
@@ -28,6 +28,8 @@ from processscheduler.util import sort_no_duplicates
 class WorkLoad(ResourceConstraint):
     """set a mini/maxi/exact number of slots a resource can be scheduled."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         resource,
@@ -44,16 +46,18 @@ class WorkLoad(ResourceConstraint):
 
         kind: optional string, default to 'max', can be 'min' or 'exact'
         """
-        super().__init__(optional)
-
         if kind not in ["exact", "max", "min"]:
             raise ValueError("kind must either be 'exact', 'min' or 'max'")
 
+        super().__init__(optional)
+
         if isinstance(resource, Worker):
             workers = [resource]
         elif isinstance(resource, CumulativeWorker):
             workers = resource.cumulative_workers
 
+        # all the assertions are set at once, as a single conjunction
+        assertions = []
         for time_interval in dict_time_intervals_and_bound:
             number_of_time_slots = dict_time_intervals_and_bound[time_interval]
 
@@ -76,14 +80,14 @@ class WorkLoad(ResourceConstraint):
                         )
                     )
                     # prevent solutions where duration would be negative
-                    self.set_assertions(dur >= 0)
+                    assertions.append(dur >= 0)
                     # 4 different cases to take into account
                     cond1 = And(
                         start_task_i >= time_interval_lower_bound,
                         end_task_i <= time_interval_upper_bound,
                     )
                     asst1 = Implies(cond1, dur == end_task_i - start_task_i)
-                    self.set_assertions(asst1)
+                    assertions.append(asst1)
                     # overlap at lower bound
                     cond2 = And(
                         start_task_i < time_interval_lower_bound,
@@ -92,7 +96,7 @@ class WorkLoad(ResourceConstraint):
                     asst2 = Implies(
                         cond2, dur == end_task_i - time_interval_lower_bound
                     )
-                    self.set_assertions(asst2)
+                    assertions.append(asst2)
                     # overlap at upper bound
                     cond3 = And(
                         start_task_i < time_interval_upper_bound,
@@ -101,7 +105,7 @@ class WorkLoad(ResourceConstraint):
                     asst3 = Implies(
                         cond3, dur == time_interval_upper_bound - start_task_i
                     )
-                    self.set_assertions(asst3)
+                    assertions.append(asst3)
                     # all overlap
                     cond4 = And(
                         start_task_i < time_interval_lower_bound,
@@ -111,12 +115,12 @@ class WorkLoad(ResourceConstraint):
                         cond4,
                         dur == time_interval_upper_bound - time_interval_lower_bound,
                     )
-                    self.set_assertions(asst4)
+                    assertions.append(asst4)
 
-                    # make these constraints mutual: no overlap
-                    self.set_assertions(
-                        Implies(Not(Or([cond1, cond2, cond3, cond4])), dur == 0)
-                    )
+                    # make these constraints mutual: no overlap. This is
+                    # Implies(Not(Or(cond1, ..., cond4)), dur == 0) with the
+                    # negation already removed
+                    assertions.append(Or(cond1, cond2, cond3, cond4, dur == 0))
 
                     # finally, store this variable in the duratins list
                     durations.append(dur)
@@ -129,12 +133,16 @@ class WorkLoad(ResourceConstraint):
             elif kind == "min":
                 wl_constrt = Sum(durations) >= number_of_time_slots
 
-            self.set_assertions(wl_constrt)
+            assertions.append(wl_constrt)
+
+        self.set_assertions(And(assertions))
 
 
 class ResourceUnavailable(ResourceConstraint):
     """set unavailablity or a resource, in terms of busy intervals"""
 
+    __slots__ = ()
+
     def __init__(
         self, resource, list_of_time_intervals, optional: Optional[bool] = False
     ) -> None:
@@ -152,22 +160,26 @@ class ResourceUnavailable(ResourceConstraint):
         elif isinstance(resource, CumulativeWorker):
             workers = resource.cumulative_workers
 
+        assertions = []
         for interval_lower_bound, interval_upper_bound in list_of_time_intervals:
             # add constraints on each busy interval
             for worker in workers:
                 for start_task_i, end_task_i in worker.get_busy_intervals():
-                    self.set_assertions(
+                    assertions.append(
                         Xor(
                             start_task_i >= interval_upper_bound,
                             end_task_i <= interval_lower_bound,
                         )
                     )
+        self.set_assertions(And(assertions))
 
 
 class ResourceTasksDistance(ResourceConstraint):
     """Force a minimal/exact/maximal number time unitary periods between tasks for a single resource. This
     distance constraint is restricted to a certain number of time intervals"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         worker,
@@ -189,8 +201,7 @@ class ResourceTasksDistance(ResourceConstraint):
         # sort both lists
         sorted_starts, c1 = sort_no_duplicates(starts)
         sorted_ends, c2 = sort_no_duplicates(ends)
-        for c in c1 + c2:
-            self.set_assertions(c)
+        assertions = c1 + c2
         # from now, starts and ends are sorted in asc order
         # the space between two consecutive tasks is the sorted_start[i+1]-sorted_end[i]
         # we just have to constraint this variable
@@ -225,7 +236,9 @@ class ResourceTasksDistance(ResourceConstraint):
                 conditions = [condition_only_scheduled_tasks]
             # finally create the constraint
             new_cstr = Implies(Or(conditions), asst)
-            self.set_assertions(new_cstr)
+            assertions.append(new_cstr)
+
+        self.set_assertions(And(assertions))
 
 
 #
@@ -236,18 +249,22 @@ class SameWorkers(ResourceConstraint):
     be the same
     """
 
+    __slots__ = ()
+
     def __init__(
         self, alternate_workers_1, alternate_workers_2, optional: Optional[bool] = False
     ):
         super().__init__(optional)
         # we check resources in alt work 1, if it is present in
         # Select worker 2 as well, then add a constraint
+        assertions = []
         for res_work_1 in alternate_workers_1.selection_dict:
             if res_work_1 in alternate_workers_2.selection_dict:
-                self.set_assertions(
+                assertions.append(
                     alternate_workers_1.selection_dict[res_work_1]
                     == alternate_workers_2.selection_dict[res_work_1]
                 )
+        self.set_assertions(And(assertions))
 
 
 class DistinctWorkers(ResourceConstraint):
@@ -255,15 +272,19 @@ class DistinctWorkers(ResourceConstraint):
     be the same
     """
 
+    __slots__ = ()
+
     def __init__(
         self, alternate_workers_1, alternate_workers_2, optional: Optional[bool] = False
     ):
         super().__init__(optional)
         # we check resources in alt work 1, if it is present in
         # alterna worker 2 as well, then add a constraint
+        assertions = []
         for res_work_1 in alternate_workers_1.selection_dict:
             if res_work_1 in alternate_workers_2.selection_dict:
-                self.set_assertions(
+                assertions.append(
                     alternate_workers_1.selection_dict[res_work_1]
                     != alternate_workers_2.selection_dict[res_work_1]
                 )
+        self.set_assertions(And(assertions))
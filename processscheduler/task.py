@@ -40,6 +40,8 @@ class Task(_NamedUIDObject):
         self.start = Int("%s_start" % name)  # type: ArithRef
         self.end = Int("%s_end" % name)  # type: ArithRef
         self.duration = Int("%s_duration" % name)  # type: ArithRef
+        # a lower bound for the duration, known before the problem is solved
+        self.min_duration = 0  # type: int
 
         # by default, the task is mandatory
         self.scheduled = True  # type: Union[bool, BoolRef]
@@ -221,6 +223,7 @@ class FixedDurationTask(Task):
         if not is_positive_integer(work_amount):
             raise TypeError("work_amount me be a positive integer")
 
+        self.min_duration = duration
         self.work_amount = work_amount
         self.priority = priority
 
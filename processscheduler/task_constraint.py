@@ -15,13 +15,33 @@
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see <http://www.gnu.org/licenses/>.
 
-import uuid
+from functools import lru_cache
+import operator
 from typing import Optional
 
-from z3 import And, Bool, BoolRef, If, Implies, Not, Or, PbEq, PbGe, PbLe, Xor
+from z3 import And, Bool, BoolRef, If, Implies, IntVal, Or
 
 from processscheduler.constraint import TaskConstraint
-from processscheduler.util import sort_no_duplicates
+from processscheduler.util import get_cardinality_assertion, sort_no_duplicates
+
+
+@lru_cache(maxsize=None)
+def _cached_intval(value: int):
+    return IntVal(value)
+
+
+def _intval(value):
+    """Return the z3 integer literal for a python int. Literals are cached, the same
+    values (0, horizon etc.) are used by many constraints. Any other value is
+    returned unchanged."""
+    if isinstance(value, int):
+        return _cached_intval(value)
+    return value
+
+
+# the comparison between task_before.end + offset and task_after.start
+# for each kind of TaskPrecedence
+_PRECEDENCE_OPS = {"lax": operator.le, "strict": operator.lt, "tight": operator.eq}
 
 #
 # Tasks constraints for two or more classes
@@ -29,6 +49,8 @@ from processscheduler.util import sort_no_duplicates
 class TaskPrecedence(TaskConstraint):
     """Task precedence relation"""
 
+    __slots__ = ("offset", "kind")
+
     def __init__(
         self,
         task_before,
@@ -44,96 +66,73 @@ class TaskPrecedence(TaskConstraint):
         STRICT constraint: task1_before_end + offset < task_after_start
         TIGHT constraint: task1_before_end + offset == task_after_start
         """
-        super().__init__(optional)
-
-        if kind not in ["lax", "strict", "tight"]:
+        precedence_op = _PRECEDENCE_OPS.get(kind) if isinstance(kind, str) else None
+        if precedence_op is None:
             raise ValueError("kind must either be 'lax', 'strict' or 'tight'")
 
         if not isinstance(offset, int) or offset < 0:
             raise ValueError("offset must be a positive integer")
 
+        super().__init__(optional)
+
         self.offset = offset
         self.kind = kind
 
-        lower = task_before.end + offset if offset > 0 else task_before.end
+        lower = task_before.end if offset == 0 else task_before.end + _intval(offset)
         upper = task_after.start
 
-        if kind == "lax":
-            scheduled_assertion = lower <= upper
-        elif kind == "strict":
-            scheduled_assertion = lower < upper
-        else:  # kind == 'tight':
-            scheduled_assertion = lower == upper
-
-        if task_before.optional or task_after.optional:
-            # both tasks must be scheduled so that the precedence constraint applies
-            self.set_assertions(
-                Implies(
-                    And(task_before.scheduled, task_after.scheduled),
-                    scheduled_assertion,
-                )
-            )
-        else:
-            self.set_assertions(scheduled_assertion)
+        scheduled_assertion = precedence_op(lower, upper)
+
+        self.set_assertions(self._guard(scheduled_assertion, task_before, task_after))
 
 
 class TasksStartSynced(TaskConstraint):
     """Two tasks that must start at the same time"""
 
+    __slots__ = ()
+
     def __init__(self, task_1, task_2, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
 
         scheduled_assertion = task_1.start == task_2.start
 
-        if task_1.optional or task_2.optional:
-            # both tasks must be scheduled so that the startsynced constraint applies
-            self.set_assertions(
-                Implies(And(task_1.scheduled, task_2.scheduled), scheduled_assertion)
-            )
-        else:
-            self.set_assertions(scheduled_assertion)
+        self.set_assertions(self._guard(scheduled_assertion, task_1, task_2))
 
 
 class TasksEndSynced(TaskConstraint):
     """Two tasks that must complete at the same time"""
 
+    __slots__ = ()
+
     def __init__(self, task_1, task_2, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
 
         scheduled_assertion = task_1.end == task_2.end
 
-        if task_1.optional or task_2.optional:
-            # both tasks must be scheduled so that the endsynced constraint applies
-            self.set_assertions(
-                Implies(And(task_1.scheduled, task_2.scheduled), scheduled_assertion)
-            )
-        else:
-            self.set_assertions(scheduled_assertion)
+        self.set_assertions(self._guard(scheduled_assertion, task_1, task_2))
 
 
 class TasksDontOverlap(TaskConstraint):
     """Two tasks must not overlap, i.e. one needs to be completed before
     the other can be processed"""
 
+    __slots__ = ()
+
     def __init__(self, task_1, task_2, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
 
-        scheduled_assertion = Xor(
-            task_2.start >= task_1.end, task_1.start >= task_2.end
-        )
+        # both disjuncts can only be true at the same time for two zero duration
+        # tasks that happen at the same instant, which do not overlap either
+        scheduled_assertion = Or(task_2.start >= task_1.end, task_1.start >= task_2.end)
 
-        if task_1.optional or task_2.optional:
-            # if one task is not scheduledboth tasks must be scheduled so that the not overlap constraint applies
-            self.set_assertions(
-                Implies(And(task_1.scheduled, task_2.scheduled), scheduled_assertion)
-            )
-        else:
-            self.set_assertions(scheduled_assertion)
+        self.set_assertions(self._guard(scheduled_assertion, task_1, task_2))
 
 
 class TasksContiguous(TaskConstraint):
     """A list of tasks are scheduled contiguously."""
 
+    __slots__ = ()
+
     def __init__(self, list_of_tasks, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
 
@@ -142,8 +141,7 @@ class TasksContiguous(TaskConstraint):
         # sort both lists
         sorted_starts, c1 = sort_no_duplicates(starts)
         sorted_ends, c2 = sort_no_duplicates(ends)
-        for c in c1 + c2:
-            self.set_assertions(c)
+        assertions = c1 + c2
         # from now, starts and ends are sorted in asc order
         # the space between two consecutive tasks is the sorted_start[i+1]-sorted_end[i]
         # we just have to constraint this variable
@@ -155,7 +153,9 @@ class TasksContiguous(TaskConstraint):
             )
             # finally create the constraint
             new_cstr = Implies(Or(condition_only_scheduled_tasks), asst)
-            self.set_assertions(new_cstr)
+            assertions.append(new_cstr)
+
+        self.set_assertions(And(assertions))
 
 
 #
@@ -164,91 +164,85 @@ class TasksContiguous(TaskConstraint):
 class TaskStartAt(TaskConstraint):
     """One task must start at the desired time"""
 
+    __slots__ = ("value",)
+
     def __init__(self, task, value: int, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
         self.value = value
 
-        scheduled_assertion = task.start == value
+        scheduled_assertion = task.start == _intval(value)
 
-        if task.optional:
-            self.set_assertions(Implies(task.scheduled, scheduled_assertion))
-        else:
-            self.set_assertions(scheduled_assertion)
+        self.set_assertions(self._guard(scheduled_assertion, task))
 
 
 class TaskStartAfterStrict(TaskConstraint):
     """task.start > value"""
 
+    __slots__ = ("value",)
+
     def __init__(self, task, value: int, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
         self.value = value
 
-        scheduled_assertion = task.start > value
+        scheduled_assertion = task.start > _intval(value)
 
-        if task.optional:
-            self.set_assertions(Implies(task.scheduled, scheduled_assertion))
-        else:
-            self.set_assertions(scheduled_assertion)
+        self.set_assertions(self._guard(scheduled_assertion, task))
 
 
 class TaskStartAfterLax(TaskConstraint):
     """task.start >= value"""
 
+    __slots__ = ("value",)
+
     def __init__(self, task, value: int, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
         self.value = value
 
-        scheduled_assertion = task.start >= value
+        scheduled_assertion = task.start >= _intval(value)
 
-        if task.optional:
-            self.set_assertions(Implies(task.scheduled, scheduled_assertion))
-        else:
-            self.set_assertions(scheduled_assertion)
+        self.set_assertions(self._guard(scheduled_assertion, task))
 
 
 class TaskEndAt(TaskConstraint):
     """On task must complete at the desired time"""
 
+    __slots__ = ("value",)
+
     def __init__(self, task, value: int, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
         self.value = value
 
-        scheduled_assertion = task.end == value
+        scheduled_assertion = task.end == _intval(value)
 
-        if task.optional:
-            self.set_assertions(Implies(task.scheduled, scheduled_assertion))
-        else:
-            self.set_assertions(scheduled_assertion)
+        self.set_assertions(self._guard(scheduled_assertion, task))
 
 
 class TaskEndBeforeStrict(TaskConstraint):
     """task.end < value"""
 
+    __slots__ = ("value",)
+
     def __init__(self, task, value: int, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
         self.value = value
 
-        scheduled_assertion = task.end < value
+        scheduled_assertion = task.end < _intval(value)
 
-        if task.optional:
-            self.set_assertions(Implies(task.scheduled, scheduled_assertion))
-        else:
-            self.set_assertions(scheduled_assertion)
+        self.set_assertions(self._guard(scheduled_assertion, task))
 
 
 class TaskEndBeforeLax(TaskConstraint):
     """task.end <= value"""
 
+    __slots__ = ("value",)
+
     def __init__(self, task, value: int, optional: Optional[bool] = False) -> None:
         super().__init__(optional)
         self.value = value
 
-        scheduled_assertion = task.end <= value
+        scheduled_assertion = task.end <= _intval(value)
 
-        if task.optional:
-            self.set_assertions(Implies(task.scheduled, scheduled_assertion))
-        else:
-            self.set_assertions(scheduled_assertion)
+        self.set_assertions(self._guard(scheduled_assertion, task))
 
 
 #
@@ -257,13 +251,15 @@ class TaskEndBeforeLax(TaskConstraint):
 class OptionalTaskConditionSchedule(TaskConstraint):
     """An optional task that is scheduled only if a condition is fulfilled."""
 
+    __slots__ = ()
+
     def __init__(
         self, task, condition: BoolRef, optional: Optional[bool] = False
     ) -> None:
-        super().__init__(optional)
-
         if not task.optional:
-            raise TypeError("Task %s must be optional." % task.name)
+            raise TypeError(f"Task {task.name} must be optional.")
+
+        super().__init__(optional)
 
         self.set_assertions(
             If(condition, task.scheduled == True, task.scheduled == False)
@@ -273,11 +269,13 @@ class OptionalTaskConditionSchedule(TaskConstraint):
 class OptionalTasksDependency(TaskConstraint):
     """task_2 is scheduled if and only if task_1 is scheduled"""
 
-    def __init__(self, task_1, task_2, optional: Optional[bool] = False) -> None:
-        super().__init__(optional)
+    __slots__ = ()
 
+    def __init__(self, task_1, task_2, optional: Optional[bool] = False) -> None:
         if not task_2.optional:
-            raise TypeError("Task %s must be optional." % task_2.name)
+            raise TypeError(f"Task {task_2.name} must be optional.")
+
+        super().__init__(optional)
 
         self.set_assertions(task_1.scheduled == task_2.scheduled)
 
@@ -286,6 +284,8 @@ class ForceScheduleNOptionalTasks(TaskConstraint):
     """Given a set of m different optional tasks, force the solver to schedule
     at at least/at most/exactly n tasks, with 0 < n <= m."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         list_of_optional_tasks,
@@ -293,22 +293,19 @@ class ForceScheduleNOptionalTasks(TaskConstraint):
         kind: Optional[str] = "exact",
         optional: Optional[bool] = False,
     ) -> None:
-        super().__init__(optional)
-
-        problem_function = {"min": PbGe, "max": PbLe, "exact": PbEq}
-
-        # first check that all tasks from the list_of_optional_tasks are
-        # actually optional
+        # all scheduled variables to take into account, checking on the way that
+        # all tasks from the list_of_optional_tasks are actually optional
+        sched_vars = []
         for task in list_of_optional_tasks:
             if not task.optional:
                 raise TypeError(
-                    "This class %s must excplicitely be set as optional." % task.name
+                    f"This class {task.name} must explicitly be set as optional."
                 )
-        # all scheduled variables to take into account
-        sched_vars = [task.scheduled for task in list_of_optional_tasks]
-        asst = problem_function[kind](
-            [(scheduled, True) for scheduled in sched_vars], nb_tasks_to_schedule
-        )
+            sched_vars.append(task.scheduled)
+
+        super().__init__(optional)
+
+        asst = get_cardinality_assertion(sched_vars, nb_tasks_to_schedule, kind)
         self.set_assertions(asst)
 
 
@@ -316,6 +313,8 @@ class ScheduleNTasksInTimeIntervals(TaskConstraint):
     """Given a set of m different tasks, and a list of time intervals, schedule N tasks among m
     in this time interval"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         list_of_tasks,
@@ -324,54 +323,70 @@ class ScheduleNTasksInTimeIntervals(TaskConstraint):
         kind: Optional[str] = "exact",
         optional: Optional[bool] = False,
     ) -> None:
-        super().__init__(optional)
-
-        problem_function = {"min": PbGe, "max": PbLe, "exact": PbEq}
-
-        # first check that all tasks from the list_of_optional_tasks are
-        # actually optional
+        # check arguments before any other work is done
         if not isinstance(list_of_tasks, list):
             raise TypeError("list_of_task must be a list")
 
         if not isinstance(list_of_time_intervals, list):
             raise TypeError("list_of_time_intervals must be a list of list")
 
+        super().__init__(optional)
+
+        # lower and upper bounds of the time intervals, extracted once for all tasks.
+        # Unpacking also checks that each interval has exactly two bounds
+        lower_bounds = []
+        upper_bounds = []
+        for lower_bound, upper_bound in list_of_time_intervals:
+            lower_bounds.append(lower_bound)
+            upper_bounds.append(upper_bound)
+
         # count the number of tasks that re scheduled in this time interval
         all_bools = []
+        per_task_assertions = []
+        # a task that is passed twice is counted once
+        processed_tasks = set()
         for task in list_of_tasks:
-            # for this task, the logic expression is that any of its start or end must be
-            # between two consecutive intervals
+            if task in processed_tasks:
+                continue
+            processed_tasks.add(task)
+            # the task is in the time interval if and only if it fits entirely
+            # inside. Overlapping an interval bound is then excluded by the range itself
+            task_start = task.start
+            task_end = task.end
             bools_for_this_task = []
-            for time_interval in list_of_time_intervals:
+            for i, (lower_bound, upper_bound) in enumerate(
+                zip(lower_bounds, upper_bounds)
+            ):
+                # the task cannot fit in a time interval shorter than its
+                # minimal duration, no need to pass this case to the solver
+                if (
+                    isinstance(lower_bound, int)
+                    and isinstance(upper_bound, int)
+                    and upper_bound - lower_bound < task.min_duration
+                ):
+                    continue
                 task_in_time_interval = Bool(
-                    "InTimeIntervalTask_%s_%i" % (task.name, uuid.uuid4().int)
+                    f"InTimeIntervalTask_{task.name}_{self.uid}_{i}"
+                )
+                per_task_assertions.append(
+                    task_in_time_interval
+                    == And(task_start >= lower_bound, task_end <= upper_bound)
                 )
-                lower_bound, upper_bound = time_interval
-                cstrs = [
-                    task.start >= lower_bound,
-                    task.end <= upper_bound,
-                    Not(
-                        And(task.start < lower_bound, task.end > lower_bound)
-                    ),  # overlap at start
-                    Not(
-                        And(task.start < upper_bound, task.end > upper_bound)
-                    ),  # overlap at end
-                    Not(And(task.start < lower_bound, task.end > upper_bound)),
-                ]  # full overlap
-                asst = Implies(task_in_time_interval, And(cstrs))
-                self.set_assertions(asst)
                 bools_for_this_task.append(task_in_time_interval)
-            # only one maximum bool to True from the previous possibilities
-            asst_tsk = PbLe([(scheduled, True) for scheduled in bools_for_this_task], 1)
-            self.set_assertions(asst_tsk)
-            all_bools.extend(bools_for_this_task)
+            if not bools_for_this_task:
+                # this task can't be in any of the time intervals
+                continue
+            # the task is in the time intervals if it is in any of them
+            task_in_time_intervals = Bool(f"InTimeIntervalTask_{task.name}_{self.uid}")
+            per_task_assertions.append(
+                task_in_time_intervals == Or(*bools_for_this_task)
+            )
+            all_bools.append(task_in_time_intervals)
 
-        # we also have to exclude all the other cases, where start or end can be between two intervals
         # then set the constraint for the number of tasks to schedule
-        asst_pb = problem_function[kind](
-            [(scheduled, True) for scheduled in all_bools], nb_tasks_to_schedule
-        )
-        self.set_assertions(asst_pb)
+        asst_pb = get_cardinality_assertion(all_bools, nb_tasks_to_schedule, kind)
+        # a single assertion for the whole constraint
+        self.set_assertions(And(*per_task_assertions, asst_pb))
 
 
 #
@@ -380,6 +395,8 @@ class ScheduleNTasksInTimeIntervals(TaskConstraint):
 class TaskUnloadBuffer(TaskConstraint):
     """A tasks that unloads a buffer"""
 
+    __slots__ = ("quantity", "task", "buffer")
+
     def __init__(
         self,
         task,
@@ -399,6 +416,8 @@ class TaskUnloadBuffer(TaskConstraint):
 class TaskLoadBuffer(TaskConstraint):
     """A task that loads a buffer"""
 
+    __slots__ = ("quantity", "task", "buffer")
+
     def __init__(
         self,
         task,
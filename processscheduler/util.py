@@ -15,7 +15,10 @@
 # You should have received a copy of the GNU General Public License along with
 # this program. If not, see <http://www.gnu.org/licenses/>.
 
-from z3 import And, FreshInt, If, Or
+from z3 import And, BoolRef, BoolVal, FreshInt, If, Not, Or, PbEq, PbGe, PbLe
+
+# z3 pseudo boolean function for each kind of cardinality constraint
+PB_FUNCTIONS = {"min": PbGe, "max": PbLe, "exact": PbEq}
 
 #
 # Functions over python types (ints, strings, etc.)
@@ -54,6 +57,32 @@ def calc_parabola_from_two_points(vector_x, vector_y):
     return a, b, c
 
 
+def get_cardinality_assertion(list_of_bools, nb: int, kind: str) -> BoolRef:
+    """Return the assertion that at least (kind 'min'), at most (kind 'max') or
+    exactly (kind 'exact') nb booleans from the list are True.
+
+    Trivial cases are expressed using And/Or, which are much cheaper for the
+    solver than a pseudo boolean constraint. Otherwise a PbGe/PbLe/PbEq is returned.
+    """
+    if not list_of_bools:
+        # none of the booleans can be True, i.e. the count is 0
+        if kind == "min":
+            return BoolVal(nb <= 0)
+        if kind == "max":
+            return BoolVal(nb >= 0)
+        if kind == "exact":
+            return BoolVal(nb == 0)
+    else:
+        if kind in ["exact", "min"] and nb == len(list_of_bools):
+            return And(list_of_bools)
+        if kind in ["exact", "max"] and nb == 0:
+            return Not(Or(list_of_bools))
+        if kind == "min" and nb == 1:
+            return Or(list_of_bools)
+
+    return PB_FUNCTIONS[kind]([(b, 1) for b in list_of_bools], nb)
+
+
 def sort_bubble(z3_int_list):
     """Take a list of int variables, return the list of new variables
     sorting using the bubble recursive sort"""
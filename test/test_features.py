@@ -29,6 +29,9 @@ def new_problem_or_clear() -> None:
 
 
 class TestFeatures(unittest.TestCase):
+    def setUp(self) -> None:
+        new_problem_or_clear()
+
     def test_clear_context(self) -> None:
         ps_context.main_context = None
         new_problem_or_clear()
@@ -54,7 +57,6 @@ class TestFeatures(unittest.TestCase):
     # Workers
     #
     def test_create_worker(self) -> None:
-        new_problem_or_clear()
         worker = ps.Worker("wkr")
         self.assertIsInstance(worker, ps.Worker)
         with self.assertRaises(TypeError):
@@ -63,7 +65,6 @@ class TestFeatures(unittest.TestCase):
             ps.Worker("WorkerFloatProductivity", productivity=3.14)
 
     def test_create_select_workers(self) -> None:
-        new_problem_or_clear()
         worker_1 = ps.Worker("wkr_1")
         worker_2 = ps.Worker("wkr_2")
         worker_3 = ps.Worker("wkr_3")
@@ -73,7 +74,6 @@ class TestFeatures(unittest.TestCase):
         self.assertIsInstance(double_alternative_workers, ps.SelectWorkers)
 
     def test_select_worker_wrong_number_of_workers(self) -> None:
-        new_problem_or_clear()
         worker_1 = ps.Worker("wkr_1")
         worker_2 = ps.Worker("wkr_2")
         ps.SelectWorkers([worker_1, worker_2], 2)
@@ -84,7 +84,6 @@ class TestFeatures(unittest.TestCase):
             ps.SelectWorkers([worker_1, worker_2], -1)
 
     def test_select_worker_bad_type(self) -> None:
-        new_problem_or_clear()
         worker_1 = ps.Worker("wkr_1")
         self.assertIsInstance(worker_1, ps.Worker)
         worker_2 = ps.Worker("wkr_2")
@@ -92,7 +91,6 @@ class TestFeatures(unittest.TestCase):
             ps.SelectWorkers([worker_1, worker_2], 1, kind="ee")
 
     def test_worker_same_name(self) -> None:
-        new_problem_or_clear()
         worker_1 = ps.Worker("wkr_1")
         self.assertIsInstance(worker_1, ps.Worker)
         with self.assertRaises(ValueError):
@@ -102,25 +100,21 @@ class TestFeatures(unittest.TestCase):
     # Boolean operators
     #
     def test_operator_not_(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.FixedDurationTask("t1", duration=2)
         not_constraint = ps.not_(ps.TaskStartAt(t_1, 1))
         self.assertIsInstance(not_constraint, ps.BoolRef)
 
     def test_operator_or_(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.FixedDurationTask("t1", duration=2)
         or_constraint = ps.or_([ps.TaskStartAt(t_1, 1), ps.TaskStartAt(t_1, 2)])
         self.assertIsInstance(or_constraint, ps.BoolRef)
 
     def test_operator_xor_(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.FixedDurationTask("t1", duration=2)
         xor_constraint = ps.xor_([ps.TaskStartAt(t_1, 1), ps.TaskStartAt(t_1, 2)])
         self.assertIsInstance(xor_constraint, ps.BoolRef)
 
     def test_operator_xor_2(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.FixedDurationTask("t1", duration=2)
         with self.assertRaises(TypeError):
             ps.xor_(
@@ -128,7 +122,6 @@ class TestFeatures(unittest.TestCase):
             )
 
     def test_operator_and_(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.FixedDurationTask("t1", duration=2)
         and_constraint = ps.and_(
             [ps.TaskStartAfterLax(t_1, 1), ps.TaskEndBeforeLax(t_1, 7)]
@@ -136,7 +129,6 @@ class TestFeatures(unittest.TestCase):
         self.assertIsInstance(and_constraint, ps.BoolRef)
 
     def test_nested_boolean_operators(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.VariableDurationTask("t1")
         or_constraint_1 = ps.or_([ps.TaskStartAt(t_1, 1), ps.TaskStartAt(t_1, 2)])
         or_constraint_2 = ps.or_([ps.TaskStartAt(t_1, 4), ps.TaskStartAt(t_1, 5)])
@@ -157,7 +149,6 @@ class TestFeatures(unittest.TestCase):
     # Implies
     #
     def test_implies(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.FixedDurationTask("t1", 2)
         t_2 = ps.FixedDurationTask("t2", 2)
         implies_constraint = ps.implies(t_1.start == 1, [ps.TaskStartAt(t_2, 3)])
@@ -167,7 +158,6 @@ class TestFeatures(unittest.TestCase):
     # If/Then/Else
     #
     def test_if_then_else(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.FixedDurationTask("t1", 2)
         t_2 = ps.FixedDurationTask("t2", 2)
         ite_constraint = ps.if_then_else(
@@ -193,7 +183,6 @@ class TestFeatures(unittest.TestCase):
     # Print _NamedUIDObject
     #
     def test_print_objects(self) -> None:
-        new_problem_or_clear()
         t1 = ps.FixedDurationTask("task_1", duration=1)
         t2 = ps.VariableDurationTask("task_2")
         worker_1 = ps.Worker("W1")
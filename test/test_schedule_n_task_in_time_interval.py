@@ -75,6 +75,24 @@ class ScheduleNTasksInTimeIntervals(unittest.TestCase):
         self.assertTrue(solution.tasks[task_1.name].start >= 10)
         self.assertTrue(solution.tasks[task_2.name].end <= 10)
 
+    def test_single_interval_duplicate_task(self) -> None:
+        pb = ps.SchedulingProblem(
+            "ScheduleNTasksInTimeIntervalsDuplicateTask", horizon=20
+        )
+        task_1 = ps.FixedDurationTask("task1", duration=3)
+
+        # task_1 is listed twice but must be counted once
+        cstrt = ps.ScheduleNTasksInTimeIntervals(
+            [task_1, task_1], nb_tasks_to_schedule=1, list_of_time_intervals=[[10, 13]]
+        )
+        pb.add_constraint(cstrt)
+
+        solver = ps.SchedulingSolver(pb)
+        solution = solver.solve()
+        self.assertTrue(solution)
+        self.assertEqual(solution.tasks[task_1.name].start, 10)
+        self.assertEqual(solution.tasks[task_1.name].end, 13)
+
     def test_single_interval_no_solution(self) -> None:
         pb = ps.SchedulingProblem("ScheduleNTasksInTimeIntervalsNoSolution", horizon=20)
         task_1 = ps.FixedDurationTask("task1", duration=3)
@@ -137,6 +155,44 @@ class ScheduleNTasksInTimeIntervals(unittest.TestCase):
         solution = solver.solve()
         self.assertTrue(solution)
 
+    def test_double_interval_min_duration(self) -> None:
+        pb = ps.SchedulingProblem(
+            "ScheduleNTasksInTimeIntervalsDoubleIntervalMinDuration", horizon=20
+        )
+        task_1 = ps.VariableDurationTask("task1", min_duration=4)
+
+        # the first interval is too short for task_1
+        cstrt = ps.ScheduleNTasksInTimeIntervals(
+            [task_1], nb_tasks_to_schedule=1, list_of_time_intervals=[[0, 3], [10, 15]]
+        )
+        # no boolean is created for the first interval, only for the second one
+        assertions = "%s" % cstrt.get_assertions()
+        self.assertNotIn("InTimeIntervalTask_task1_%i_0" % cstrt.uid, assertions)
+        self.assertIn("InTimeIntervalTask_task1_%i_1" % cstrt.uid, assertions)
+        pb.add_constraint(cstrt)
+        solver = ps.SchedulingSolver(pb)
+        solution = solver.solve()
+        self.assertTrue(solution)
+        self.assertTrue(solution.tasks[task_1.name].start >= 10)
+        self.assertTrue(solution.tasks[task_1.name].end <= 15)
+
+    def test_interval_too_small_for_all_tasks(self) -> None:
+        pb = ps.SchedulingProblem(
+            "ScheduleNTasksInTimeIntervalsTooSmallForAllTasks", horizon=20
+        )
+        task_1 = ps.FixedDurationTask("task1", duration=3)
+        task_2 = ps.FixedDurationTask("task2", duration=4)
+
+        # no task fits, the count is done over an empty list of booleans
+        cstrt = ps.ScheduleNTasksInTimeIntervals(
+            [task_1, task_2], nb_tasks_to_schedule=0, list_of_time_intervals=[[5, 7]]
+        )
+        self.assertNotIn("InTimeIntervalTask", "%s" % cstrt.get_assertions())
+        pb.add_constraint(cstrt)
+        solver = ps.SchedulingSolver(pb)
+        solution = solver.solve()
+        self.assertTrue(solution)
+
     def test_triple_interval_1(self) -> None:
         pb = ps.SchedulingProblem(
             "ScheduleNTasksInTimeIntervalsTripleInterval1", horizon=20
@@ -29,6 +29,9 @@ def new_problem_or_clear() -> None:
 
 
 class TestTask(unittest.TestCase):
+    def setUp(self) -> None:
+        new_problem_or_clear()
+
     def test_clear_context(self) -> None:
         ps_context.main_context = None
         new_problem_or_clear()
@@ -45,7 +48,6 @@ class TestTask(unittest.TestCase):
         self.assertIsInstance(task, ps.ZeroDurationTask)
 
     def test_create_task_fixed_duration(self) -> None:
-        new_problem_or_clear()
         task = ps.FixedDurationTask("fdt", 1)
         self.assertIsInstance(task, ps.FixedDurationTask)
         with self.assertRaises(TypeError):
@@ -74,7 +76,6 @@ class TestTask(unittest.TestCase):
         self.assertTrue(solution.tasks[vdt_3.name].duration >= 5)
 
     def test_task_types(self) -> None:
-        new_problem_or_clear()
         with self.assertRaises(TypeError):
             ps.VariableDurationTask("vdt5", max_duration=4.5)
         with self.assertRaises(TypeError):
@@ -89,13 +90,11 @@ class TestTask(unittest.TestCase):
             ps.VariableDurationTask("vdt10", work_amount=None)
 
     def test_task_same_names(self) -> None:
-        new_problem_or_clear()
         ps.VariableDurationTask("t1")
         with self.assertRaises(ValueError):
             ps.VariableDurationTask("t1")
 
     def test_eq_overloading(self) -> None:
-        new_problem_or_clear()
         task_1 = ps.ZeroDurationTask("task1")
         task_2 = ps.ZeroDurationTask("task2")
         self.assertEqual(task_1, task_1)
@@ -129,7 +128,6 @@ class TestTask(unittest.TestCase):
         self.assertEqual(len(solution.tasks["task1"].assigned_resources), 4)
 
     def test_wrong_assignement(self) -> None:
-        new_problem_or_clear()
         task_1 = ps.FixedDurationTask("task1", duration=3)
         worker_1 = ps.Worker("Worker1")
         task_1.add_required_resource(worker_1)
@@ -143,47 +141,20 @@ class TestTask(unittest.TestCase):
     #
     # Single task constraints
     #
-    def test_create_task_start_at(self) -> None:
-        new_problem_or_clear()
-        task = ps.FixedDurationTask("task", 2)
-        c = ps.TaskStartAt(task, 1)
-        self.assertIsInstance(c, ps.TaskStartAt)
-        self.assertEqual(c.value, 1)
-
-    def test_create_task_start_after_strict(self) -> None:
-        new_problem_or_clear()
-        task = ps.FixedDurationTask("task", 2)
-        c = ps.TaskStartAfterStrict(task, 3)
-        self.assertIsInstance(c, ps.TaskStartAfterStrict)
-        self.assertEqual(c.value, 3)
-
-    def test_create_task_start_after_lax(self) -> None:
-        new_problem_or_clear()
-        task = ps.FixedDurationTask("task", 2)
-        c = ps.TaskStartAfterLax(task, 3)
-        self.assertIsInstance(c, ps.TaskStartAfterLax)
-        self.assertEqual(c.value, 3)
-
-    def test_create_task_end_at(self) -> None:
-        new_problem_or_clear()
-        task = ps.FixedDurationTask("task", 2)
-        c = ps.TaskEndAt(task, 3)
-        self.assertIsInstance(c, ps.TaskEndAt)
-        self.assertEqual(c.value, 3)
-
-    def test_create_task_before_strict(self) -> None:
-        new_problem_or_clear()
+    def test_create_single_task_constraints(self) -> None:
         task = ps.FixedDurationTask("task", 2)
-        c = ps.TaskEndBeforeStrict(task, 3)
-        self.assertIsInstance(c, ps.TaskEndBeforeStrict)
-        self.assertEqual(c.value, 3)
-
-    def test_create_task_before_lax(self) -> None:
-        new_problem_or_clear()
-        task = ps.FixedDurationTask("task", 2)
-        constraint = ps.TaskEndBeforeLax(task, 3)
-        self.assertIsInstance(constraint, ps.TaskEndBeforeLax)
-        self.assertEqual(constraint.value, 3)
+        for constraint_class, value in [
+            (ps.TaskStartAt, 1),
+            (ps.TaskStartAfterStrict, 3),
+            (ps.TaskStartAfterLax, 3),
+            (ps.TaskEndAt, 3),
+            (ps.TaskEndBeforeStrict, 3),
+            (ps.TaskEndBeforeLax, 3),
+        ]:
+            with self.subTest(constraint_class=constraint_class.__name__):
+                constraint = constraint_class(task, value)
+                self.assertIsInstance(constraint, constraint_class)
+                self.assertEqual(constraint.value, value)
 
     def test_task_duration_depend_on_start(self) -> None:
         pb = ps.SchedulingProblem("TaskDurationDependsOnStart", horizon=30)
@@ -210,19 +181,14 @@ class TestTask(unittest.TestCase):
     #
     # Two tasks constraints
     #
-    def test_create_task_precedence_lax(self) -> None:
-        new_problem_or_clear()
-        t_1 = ps.FixedDurationTask("t1", duration=2)
-        t_2 = ps.FixedDurationTask("t2", duration=3)
-        precedence_constraint = ps.TaskPrecedence(t_1, t_2, offset=1, kind="lax")
-        self.assertIsInstance(precedence_constraint, ps.TaskPrecedence)
-
-    def test_create_task_precedence_tight(self) -> None:
-        new_problem_or_clear()
+    def test_create_task_precedence(self) -> None:
         t_1 = ps.FixedDurationTask("t1", duration=2)
         t_2 = ps.FixedDurationTask("t2", duration=3)
-        precedence_constraint = ps.TaskPrecedence(t_1, t_2, offset=1, kind="tight")
-        self.assertIsInstance(precedence_constraint, ps.TaskPrecedence)
+        for kind in ["lax", "strict", "tight"]:
+            with self.subTest(kind=kind):
+                precedence_constraint = ps.TaskPrecedence(t_1, t_2, offset=1, kind=kind)
+                self.assertIsInstance(precedence_constraint, ps.TaskPrecedence)
+                self.assertEqual(precedence_constraint.kind, kind)
 
     def test_create_task_precedence_strict(self) -> None:
         pb = ps.SchedulingProblem("TaskPrecedenceStrict")
@@ -238,19 +204,32 @@ class TestTask(unittest.TestCase):
         )
 
     def test_create_task_precedence_raise_exception_kind(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.FixedDurationTask("t1", duration=2)
         t_2 = ps.FixedDurationTask("t2", duration=3)
         with self.assertRaises(ValueError):
             ps.TaskPrecedence(t_1, t_2, offset=1, kind="foo")
+        with self.assertRaises(ValueError):
+            ps.TaskPrecedence(t_1, t_2, offset=1, kind=["lax"])
 
     def test_create_task_precedence_raise_exception_offset_int(self) -> None:
-        new_problem_or_clear()
         t_1 = ps.FixedDurationTask("t1", duration=2)
         t_2 = ps.FixedDurationTask("t2", duration=3)
         with self.assertRaises(ValueError):
             ps.TaskPrecedence(t_1, t_2, offset=1.5, kind="lax")  # should be int
 
+    def test_task_constraints_have_no_dict(self) -> None:
+        t_1 = ps.FixedDurationTask("t1", duration=2)
+        t_2 = ps.FixedDurationTask("t2", duration=3, optional=True)
+        constraints = [
+            ps.TaskPrecedence(t_1, t_2, offset=1),
+            ps.TasksDontOverlap(t_1, t_2),
+            ps.TaskStartAt(t_1, 1),
+            ps.TaskEndBeforeLax(t_2, 5, optional=True),
+            ps.ForceScheduleNOptionalTasks([t_2]),
+        ]
+        for constraint in constraints:
+            self.assertFalse(hasattr(constraint, "__dict__"))
+
     def test_tasks_dont_overlap(self) -> None:
         pb = ps.SchedulingProblem("TasksDontOverlap")
         t_1 = ps.FixedDurationTask("t1", duration=7)
@@ -262,6 +241,17 @@ class TestTask(unittest.TestCase):
         self.assertTrue(solution)
         self.assertEqual(solution.horizon, 18)
 
+    def test_zero_duration_tasks_dont_overlap(self) -> None:
+        pb = ps.SchedulingProblem("ZeroDurationTasksDontOverlap", horizon=5)
+        t_1 = ps.ZeroDurationTask("t1")
+        t_2 = ps.ZeroDurationTask("t2")
+        pb.add_constraint(ps.TaskStartAt(t_1, 3))
+        pb.add_constraint(ps.TaskStartAt(t_2, 3))
+        pb.add_constraint(ps.TasksDontOverlap(t_1, t_2))
+        solver = ps.SchedulingSolver(pb)
+        solution = solver.solve()
+        self.assertTrue(solution)
+
     def test_tasks_start_sync(self) -> None:
         pb = ps.SchedulingProblem("TasksStartSync")
         t_1 = ps.FixedDurationTask("t1", duration=2)
@@ -284,13 +274,16 @@ class TestTask(unittest.TestCase):
         self.assertEqual(solution.tasks[t_1.name].end, solution.tasks[t_2.name].end)
 
     def test_schedule_n_task_raise_exception(self) -> None:
-        new_problem_or_clear()
         with self.assertRaises(TypeError):
             ps.ScheduleNTasksInTimeIntervals(
                 "list_of_tasks", 1, "list_of_time_intervals"
             )
         with self.assertRaises(TypeError):
             ps.ScheduleNTasksInTimeIntervals([], 1, "list_of_time_intervals")
+        task_1 = ps.FixedDurationTask("t1", duration=2)
+        with self.assertRaises(ValueError):
+            # an interval must have exactly two bounds
+            ps.ScheduleNTasksInTimeIntervals([task_1], 1, [[0, 5, 9]])
 
     #
     # List of tasks constraints
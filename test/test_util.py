@@ -0,0 +1,81 @@
+# Copyright (c) 2020-2021 Thomas Paviot (tpaviot@gmail.com)
+#
+# This file is part of ProcessScheduler.
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later
+# version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+
+from z3 import Bools, is_and, is_false, is_not, is_or, is_true, Solver, unsat
+
+from processscheduler.util import PB_FUNCTIONS, get_cardinality_assertion
+
+
+class TestCardinalityAssertion(unittest.TestCase):
+    def assert_equivalent_to_pb(self, list_of_bools, nb, kind) -> None:
+        """Check that no assignment of the booleans makes the assertion differ
+        from the pseudo boolean constraint."""
+        solver = Solver()
+        solver.add(
+            get_cardinality_assertion(list_of_bools, nb, kind)
+            != PB_FUNCTIONS[kind]([(b, 1) for b in list_of_bools], nb)
+        )
+        self.assertEqual(solver.check(), unsat)
+
+    def test_exact_all(self) -> None:
+        bools = Bools("a b c")
+        self.assertTrue(is_and(get_cardinality_assertion(bools, 3, "exact")))
+        self.assert_equivalent_to_pb(bools, 3, "exact")
+
+    def test_min_all(self) -> None:
+        bools = Bools("a b c")
+        self.assertTrue(is_and(get_cardinality_assertion(bools, 3, "min")))
+        self.assert_equivalent_to_pb(bools, 3, "min")
+
+    def test_exact_none(self) -> None:
+        bools = Bools("a b c")
+        self.assertTrue(is_not(get_cardinality_assertion(bools, 0, "exact")))
+        self.assert_equivalent_to_pb(bools, 0, "exact")
+
+    def test_max_none(self) -> None:
+        bools = Bools("a b c")
+        self.assertTrue(is_not(get_cardinality_assertion(bools, 0, "max")))
+        self.assert_equivalent_to_pb(bools, 0, "max")
+
+    def test_min_one(self) -> None:
+        bools = Bools("a b c")
+        self.assertTrue(is_or(get_cardinality_assertion(bools, 1, "min")))
+        self.assert_equivalent_to_pb(bools, 1, "min")
+
+    def test_pb_fallback(self) -> None:
+        bools = Bools("a b c d")
+        for kind in ["min", "max", "exact"]:
+            for nb in range(0, 6):
+                with self.subTest(kind=kind, nb=nb):
+                    self.assert_equivalent_to_pb(bools, nb, kind)
+
+    def test_empty_list(self) -> None:
+        # the count over an empty list is 0
+        self.assertTrue(is_true(get_cardinality_assertion([], 0, "exact")))
+        self.assertTrue(is_false(get_cardinality_assertion([], 1, "exact")))
+        self.assertTrue(is_true(get_cardinality_assertion([], 0, "min")))
+        self.assertTrue(is_false(get_cardinality_assertion([], 1, "min")))
+        self.assertTrue(is_true(get_cardinality_assertion([], 0, "max")))
+        self.assertTrue(is_true(get_cardinality_assertion([], 2, "max")))
+
+    def test_wrong_kind(self) -> None:
+        with self.assertRaises(KeyError):
+            get_cardinality_assertion(Bools("a b"), 1, "foo")
+
+
+if __name__ == "__main__":
+    unittest.main()